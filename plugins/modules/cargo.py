@@ -120,18 +120,34 @@ import re
 
 from ansible.module_utils.basic import AnsibleModule
 
+argument_spec = dict(
+    executable=dict(type="path"),
+    name=dict(required=True, type="list", elements="str"),
+    path=dict(type="path"),
+    state=dict(default="present", choices=["present", "absent", "latest"]),
+    version=dict(type="str"),
+    locked=dict(default=False, type="bool"),
+    directory=dict(type="path"),
+    features=dict(default=[], type="list", elements="str"),
+)
+
+INSTALLED_PACKAGE_RE = re.compile(r"^([\w\-]+) v(\S+).*:$")
+PUBLISHED_VERSION_RE = re.compile(r'^\S+ = "([^"]+)"')
+
 
 class Cargo:
     def __init__(self, module, **kwargs):
         self.module = module
         self.executable = [kwargs["executable"] or module.get_bin_path("cargo", True)]
         self.name = kwargs["name"]
+        self._names = frozenset(self.name)
         self.path = kwargs["path"]
         self.state = kwargs["state"]
         self.version = kwargs["version"]
         self.locked = kwargs["locked"]
         self.directory = kwargs["directory"]
         self.features = kwargs["features"]
+        self._source_versions = None
 
     @property
     def path(self):
@@ -144,7 +160,7 @@ class Cargo:
         self._path = path
 
     def _exec(self, args, run_in_check_mode=False, check_rc=True, add_package_name=True):
-        if not self.module.check_mode or (self.module.check_mode and run_in_check_mode):
+        if not self.module.check_mode or run_in_check_mode:
             cmd = self.executable + args
             rc, out, err = self.module.run_command(cmd, check_rc=check_rc)
             return out, err
@@ -158,10 +174,12 @@ class Cargo:
 
         data, dummy = self._exec(cmd, True, False, False)
 
-        package_regex = re.compile(r"^([\w\-]+) v(\S+).*:$")
         installed = {}
         for line in data.splitlines():
-            package_info = package_regex.match(line)
+            # Only match the header lines of requested packages, binaries are listed on indented lines below them
+            if not line.endswith(":") or line.partition(" ")[0] not in self._names:
+                continue
+            package_info = INSTALLED_PACKAGE_RE.match(line)
             if package_info:
                 installed[package_info.group(1)] = package_info.group(2)
 
@@ -185,8 +203,7 @@ class Cargo:
             cmd += ["--features", ",".join(self.features)]
         return self._exec(cmd)
 
-    def is_outdated(self, name):
-        installed_version = self.get_installed().get(name)
+    def is_outdated(self, name, installed_version):
         latest_version = (
             self.get_latest_published_version(name) if not self.directory else self.get_source_directory_version(name)
         )
@@ -196,32 +213,28 @@ class Cargo:
         cmd = ["search", name, "--limit", "1"]
         data, dummy = self._exec(cmd, True, False, False)
 
-        match = re.search(r'"(.+)"', data)
+        match = PUBLISHED_VERSION_RE.match(data)
         if not match:
             self.module.fail_json(msg=f"No published version for package {name} found")
         return match.group(1)
 
     def get_source_directory_version(self, name):
-        cmd = [
-            "metadata",
-            "--format-version",
-            "1",
-            "--no-deps",
-            "--manifest-path",
-            os.path.join(self.directory, "Cargo.toml"),
-        ]
-        data, dummy = self._exec(cmd, True, False, False)
-        manifest = json.loads(data)
-
-        package = next(
-            (package for package in manifest["packages"] if package["name"] == name),
-            None,
-        )
-        if not package:
-            self.module.fail_json(
-                msg=f"Package {name} not defined in source, found: {[x['name'] for x in manifest['packages']]}"
-            )
-        return package["version"]
+        if self._source_versions is None:
+            cmd = [
+                "metadata",
+                "--format-version",
+                "1",
+                "--no-deps",
+                "--manifest-path",
+                os.path.join(self.directory, "Cargo.toml"),
+            ]
+            data, dummy = self._exec(cmd, True, False, False)
+            manifest = json.loads(data)
+            self._source_versions = {package["name"]: package["version"] for package in manifest["packages"]}
+
+        if name not in self._source_versions:
+            self.module.fail_json(msg=f"Package {name} not defined in source, found: {list(self._source_versions)}")
+        return self._source_versions[name]
 
     def uninstall(self, packages=None):
         cmd = ["uninstall"]
@@ -230,17 +243,7 @@ class Cargo:
 
 
 def main():
-    arg_spec = dict(
-        executable=dict(type="path"),
-        name=dict(required=True, type="list", elements="str"),
-        path=dict(type="path"),
-        state=dict(default="present", choices=["present", "absent", "latest"]),
-        version=dict(type="str"),
-        locked=dict(default=False, type="bool"),
-        directory=dict(type="path"),
-        features=dict(default=[], type="list", elements="str"),
-    )
-    module = AnsibleModule(argument_spec=arg_spec, supports_check_mode=True)
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
 
     name = module.params["name"]
     state = module.params["state"]
@@ -267,7 +270,7 @@ def main():
             changed = True
             out, err = cargo.install(to_install)
     elif state == "latest":
-        to_update = [n for n in name if n not in installed_packages or cargo.is_outdated(n)]
+        to_update = [n for n in name if n not in installed_packages or cargo.is_outdated(n, installed_packages[n])]
         if to_update:
             changed = True
             out, err = cargo.install(to_update)
@@ -0,0 +1,186 @@
+# Copyright (c) Ansible project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import textwrap
+from unittest.mock import MagicMock, call, patch
+
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson,
+    ModuleTestCase,
+    set_module_args,
+)
+
+from ansible_collections.community.general.plugins.modules import cargo
+
+INSTALL_LIST = textwrap.dedent(
+    """\
+    foo v1.0.0:
+        foo
+    baz v0.2.0 (/src/baz):
+        bar
+        baz
+    bar v3.1.4 (/src/bar):
+        bar
+        bar-cli
+    """
+)
+
+
+class CargoModuleTestCase(ModuleTestCase):
+    module = cargo
+
+    def setUp(self):
+        super().setUp()
+        ansible_module_path = "ansible_collections.community.general.plugins.modules.cargo.AnsibleModule"
+        self.mock_run_command = patch(f"{ansible_module_path}.run_command")
+        self.module_main_command = self.mock_run_command.start()
+        self.mock_get_bin_path = patch(f"{ansible_module_path}.get_bin_path")
+        self.get_bin_path = self.mock_get_bin_path.start()
+        self.get_bin_path.return_value = "/testbin/cargo"
+
+    def tearDown(self):
+        self.mock_run_command.stop()
+        self.mock_get_bin_path.stop()
+        super().tearDown()
+
+    def module_main(self, exit_exc):
+        with self.assertRaises(exit_exc) as exc:
+            self.module.main()
+        return exc.exception.args[0]
+
+    def make_cargo(self, **kwargs):
+        params = dict(
+            executable="/testbin/cargo",
+            name=["foo"],
+            path=None,
+            state="present",
+            version=None,
+            locked=False,
+            directory=None,
+            features=[],
+        )
+        params.update(kwargs)
+        module = MagicMock(check_mode=False)
+        module.run_command = self.module_main_command
+        return cargo.Cargo(module, **params)
+
+    def test_get_latest_published_version_quoted_description(self):
+        self.module_main_command.return_value = (
+            0,
+            'serde = "1.0.210"    # A "generic" serialization/deserialization framework\n'
+            "... and 4 crates more (use --limit N to see more)\n",
+            "",
+        )
+
+        version = self.make_cargo(name=["serde"]).get_latest_published_version("serde")
+
+        self.assertEqual(version, "1.0.210")
+
+    def test_latest_up_to_date_quoted_description(self):
+        with set_module_args({"name": "serde", "state": "latest"}):
+            self.module_main_command.side_effect = [
+                (0, "serde v1.0.210:\n", ""),
+                (0, 'serde = "1.0.210"    # A "generic" serialization/deserialization framework\n', ""),
+            ]
+
+            result = self.module_main(AnsibleExitJson)
+
+        self.assertFalse(result["changed"])
+        self.module_main_command.assert_has_calls(
+            [
+                call(["/testbin/cargo", "install", "--list"], check_rc=False),
+                call(["/testbin/cargo", "search", "serde", "--limit", "1"], check_rc=False),
+            ]
+        )
+        self.assertEqual(self.module_main_command.call_count, 2)
+
+    def test_get_installed_only_requested_packages(self):
+        self.module_main_command.return_value = (0, INSTALL_LIST, "")
+
+        installed = self.make_cargo(name=["foo", "qux"]).get_installed()
+
+        self.assertEqual(installed, {"foo": "1.0.0"})
+        self.module_main_command.assert_called_once_with(["/testbin/cargo", "install", "--list"], check_rc=False)
+
+    def test_latest_lists_installed_packages_once(self):
+        with set_module_args({"name": ["foo", "bar"], "state": "latest"}):
+            self.module_main_command.side_effect = [
+                (0, INSTALL_LIST, ""),
+                (0, 'foo = "1.0.0"    # Foo\n', ""),
+                (0, 'bar = "3.2.0"    # Bar\n', ""),
+                (0, "", ""),
+            ]
+
+            result = self.module_main(AnsibleExitJson)
+
+        self.assertTrue(result["changed"])
+        self.module_main_command.assert_has_calls(
+            [
+                call(["/testbin/cargo", "install", "--list"], check_rc=False),
+                call(["/testbin/cargo", "search", "foo", "--limit", "1"], check_rc=False),
+                call(["/testbin/cargo", "search", "bar", "--limit", "1"], check_rc=False),
+                call(["/testbin/cargo", "install", "bar"], check_rc=True),
+            ]
+        )
+        self.assertEqual(self.module_main_command.call_count, 4)
+
+    def test_get_installed_ignores_binary_lines(self):
+        self.module_main_command.return_value = (0, INSTALL_LIST, "")
+
+        installed = self.make_cargo(name=["bar", "bar-cli"]).get_installed()
+
+        self.assertEqual(installed, {"bar": "3.1.4"})
+
+    def test_get_installed_path_headers(self):
+        self.module_main_command.return_value = (0, INSTALL_LIST, "")
+
+        installed = self.make_cargo(name=["foo", "bar", "baz"]).get_installed()
+
+        self.assertEqual(installed, {"foo": "1.0.0", "bar": "3.1.4", "baz": "0.2.0"})
+
+    def test_latest_directory_runs_metadata_once(self):
+        metadata = json.dumps(
+            {
+                "packages": [
+                    {"name": "foo", "version": "1.0.0"},
+                    {"name": "bar", "version": "3.2.0"},
+                    {"name": "baz", "version": "0.2.0"},
+                ]
+            }
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            with set_module_args({"name": ["foo", "bar", "baz"], "state": "latest", "directory": directory}):
+                self.module_main_command.side_effect = [
+                    (0, INSTALL_LIST, ""),
+                    (0, metadata, ""),
+                    (0, "", ""),
+                ]
+
+                result = self.module_main(AnsibleExitJson)
+
+        self.assertTrue(result["changed"])
+        self.module_main_command.assert_has_calls(
+            [
+                call(["/testbin/cargo", "install", "--list"], check_rc=False),
+                call(
+                    [
+                        "/testbin/cargo",
+                        "metadata",
+                        "--format-version",
+                        "1",
+                        "--no-deps",
+                        "--manifest-path",
+                        os.path.join(directory, "Cargo.toml"),
+                    ],
+                    check_rc=False,
+                ),
+                call(["/testbin/cargo", "install", "bar", "--path", directory], check_rc=True),
+            ]
+        )
+        self.assertEqual(self.module_main_command.call_count, 3)